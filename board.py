@@ -0,0 +1,195 @@
+"""Hold Board class, a lightweight copy of the game state.
+
+Boards are immutable and don't touch pygame, so they are cheap to copy
+and can be sent to other processes. Spaces are indexed the same way as
+Game.spaces: foundations, then free cells, then tableau.
+"""
+
+from random import Random
+from typing import Optional
+from constants import SUIT_COLORS, SUITS
+
+FOUNDATIONS = range(0, 4)
+FREE_CELLS = range(4, 8)
+TABLEAU = range(8, 16)
+
+BoardCard = tuple[int, str]  # Value, suit.
+Move = tuple[int, int, int]  # Source space, dest space, card count.
+
+
+def piles_up(card: BoardCard, top: Optional[BoardCard]):
+    """Check if card piles up in a foundation from top, like Card.piles_up."""
+    if not top:
+        return card[0] == 1
+    return card[1] == top[1] and card[0] == top[0] + 1
+
+
+def stacks_down(card: BoardCard, top: Optional[BoardCard]):
+    """Check if card stacks down from top, like Card.stacks_down."""
+    if not top:
+        return True
+    suits_alternate = SUIT_COLORS[card[1]] != SUIT_COLORS[top[1]]
+    return suits_alternate and card[0] == top[0] - 1
+
+
+class Board:
+    """Snapshot of every space's cards."""
+
+    __slots__ = ("_spaces", "_empty_spaces")
+
+    def __init__(self, spaces: tuple[tuple[BoardCard, ...], ...]):
+        """Create board from a tuple of card tuples for each space."""
+        self._spaces = spaces
+        self._empty_spaces = spaces[4:].count(())  # Don't count founds.
+
+    def __eq__(self, other):
+        return isinstance(other, Board) and self._spaces == other._spaces
+
+    def __hash__(self):
+        return hash(self._spaces)
+
+    def __repr__(self):
+        return f"Board({self._spaces})"
+
+    @classmethod
+    def deal(cls, deal_number: int):
+        """Create board for a deal number, matching Game.deal_cards."""
+        deck = [(value, suit) for suit in SUITS for value in range(1, 14)]
+        Random(deal_number).shuffle(deck)
+        spaces: list[tuple[BoardCard, ...]] = [() for _ in range(8)]
+        for i in range(8):
+            stack_length = 6 + (i < 4)  # First four columns are 7 cards high.
+            spaces.append(tuple(deck[:stack_length]))
+            deck = deck[stack_length:]
+        return cls(tuple(spaces))
+
+    @property
+    def empty_spaces(self):
+        """Return amount of empty spaces in tableau and free cells."""
+        return self._empty_spaces
+
+    @property
+    def foundation_count(self):
+        """Return amount of cards moved to the foundations."""
+        return sum(len(self._spaces[i]) for i in FOUNDATIONS)
+
+    @property
+    def has_won(self):
+        """Check if every card is on the foundations."""
+        return self.foundation_count == 52
+
+    @property
+    def spaces(self):
+        """Tuple of cards in each space, starting from bottom."""
+        return self._spaces
+
+    def apply(self, move: Move):
+        """Return a new board with the move made."""
+        source, dest, count = move
+        spaces = list(self._spaces)
+        cards = spaces[source][-count:]
+        spaces[source] = spaces[source][:-count]
+        spaces[dest] = spaces[dest] + cards
+        return Board(tuple(spaces))
+
+    def auto_dest(self, source: int, count: int):
+        """Get first valid dest for a stack, with the priority of Game.auto_dest:
+        Foundations, (sorted) Tableau, then Free cells."""
+        tableau = sorted(TABLEAU, key=lambda i: not self._spaces[i])
+        for space_list in (FOUNDATIONS, tableau, FREE_CELLS):
+            for dest in space_list:
+                if dest != source and self.valid_dest(source, dest, count):
+                    return dest
+        return None
+
+    def auto_foundation(self):
+        """Move exposed cards to foundation, like Game.auto_foundation.
+
+        returns:
+            tuple[Board, list[Move]]: New board and the moves that were made.
+        """
+        board = self
+        moves = []
+        for source in list(TABLEAU) + list(FREE_CELLS):
+            if not board.spaces[source]:
+                continue
+            for dest in FOUNDATIONS:
+                if board.valid_dest(source, dest, 1):
+                    move = (source, dest, 1)
+                    board = board.apply(move)
+                    moves.append(move)
+                    break
+        return board, moves
+
+    def finish(self):
+        """Repeat auto_foundation until no more moves are made,
+        like Game.handle_a_key."""
+        board = self
+        moves = []
+        while True:
+            board, sweep = board.auto_foundation()
+            if not sweep:
+                return board, moves
+            moves += sweep
+
+    def movable_count(self, source: int):
+        """Get the most cards that can be picked up from a space.
+        Only the top card of a foundation can be picked up."""
+        cards = self._spaces[source]
+        if not cards:
+            return 0
+        if source in FOUNDATIONS:
+            return 1
+        count = 1
+        while count < len(cards) and stacks_down(cards[-count], cards[-count - 1]):
+            count += 1
+        return count
+
+    def moves(self):
+        """Get every legal move, including ones out of the foundations."""
+        moves = []
+        for source in range(16):
+            run = self.movable_count(source)
+            if not run:
+                continue
+            top_value = self._spaces[source][-1][0]
+            for dest in range(16):
+                if dest == source:
+                    continue
+                dest_cards = self._spaces[dest]
+                if dest not in TABLEAU:  # Only takes single cards.
+                    counts = range(1, 2)
+                elif dest_cards:
+                    # Runs go up by one, so only one count can stack down.
+                    count = dest_cards[-1][0] - top_value
+                    counts = range(count, count + 1) if 0 < count <= run else ()
+                else:
+                    counts = range(1, run + 1)
+                for count in counts:
+                    if self.valid_dest(source, dest, count):
+                        moves.append((source, dest, count))
+        return moves
+
+    def valid_dest(self, source: int, dest: int, count: int):
+        """Check if count cards from source can move to dest, following the
+        rules of Space.valid_dest and its subclasses."""
+        cards = self._spaces[source]
+        bottom = cards[-count]
+        dest_cards = self._spaces[dest]
+        top = dest_cards[-1] if dest_cards else None
+        if dest in FOUNDATIONS:
+            return count == 1 and piles_up(bottom, top)
+        if dest in FREE_CELLS:
+            return not dest_cards and count == 1
+        if not stacks_down(bottom, top):
+            return False
+        # Game counts empty spaces with the stack already picked up.
+        source_empty = count == len(cards)
+        max_length = self._empty_spaces
+        if source_empty and source not in FOUNDATIONS:
+            max_length += 1
+        if source_empty:  # Don't count home space.
+            max_length -= 1
+        if dest_cards:  # Add to max length since not taking up empty.
+            max_length += 1
+        return count <= max_length
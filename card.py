@@ -2,18 +2,12 @@
 
 from typing import TYPE_CHECKING, Optional
 import pygame
+from constants import SUIT_COLORS
 from spritesheet import SpriteSheet
 
 if TYPE_CHECKING:
     from space import Space
 
-SUIT_COLORS = {
-    "clubs": "black",
-    "diamonds": "red",
-    "hearts": "red",
-    "spades": "black",
-}
-
 
 class Card(pygame.sprite.Sprite):
     """Card object."""
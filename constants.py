@@ -4,3 +4,11 @@ CARD_HEIGHT = 64
 CARD_WIDTH = 49
 BUFFER_SIZE = 5  # Buffer between spaces.
 STACK_OFFSET = 20
+
+SUITS = ["clubs", "diamonds", "hearts", "spades"]  # Order in the spritesheet.
+SUIT_COLORS = {
+    "clubs": "black",
+    "diamonds": "red",
+    "hearts": "red",
+    "spades": "black",
+}
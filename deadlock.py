@@ -0,0 +1,88 @@
+"""Hold DeadlockDetector class for spotting lost positions."""
+
+from board import FOUNDATIONS, FREE_CELLS, TABLEAU, Board
+
+# Most positions to expand in one search. Counted rather than timed so
+# replays always get the same answers. Each expansion takes a few tenths
+# of a millisecond, and the game's snapshot less than one, so a search
+# stays within a few milliseconds.
+SEARCH_LIMIT = 8
+
+
+def position_key(board: Board):
+    """Key for a board that ignores the order of free cells and columns,
+    since swapping them doesn't change what moves can be made."""
+    spaces = board.spaces
+    return (
+        tuple(sorted(spaces[i] for i in FOUNDATIONS)),
+        tuple(sorted(spaces[i] for i in FREE_CELLS)),
+        tuple(sorted(spaces[i] for i in TABLEAU)),
+    )
+
+
+class DeadlockDetector:
+    """Check if any sequence of moves gets more cards on the foundations.
+
+    Results are kept between checks, so positions seen before, like after
+    an undo, are answered without searching.
+    """
+
+    def __init__(self):
+        """Start with no known positions."""
+        self._known: dict[tuple, bool] = {}  # Key to whether it's dead.
+        self._undecided: set[tuple] = set()  # Searched without an answer.
+
+    def is_dead(self, board: Board):
+        """Check if board can never make progress.
+        Returns False if the search runs out of budget without an answer."""
+        key = position_key(board)
+        if key in self._undecided:
+            return False
+        if key not in self._known:
+            result = self.search(board)
+            if result is None:  # Budget is a fixed count, so it won't change.
+                self._undecided.add(key)
+                return False
+            self._known[key] = result
+        return self._known[key]
+
+    def search(self, board: Board):
+        """Search positions reachable from board, including by moving cards
+        off the foundations, for one with more cards on the foundations.
+
+        returns:
+            bool | None: Whether board is dead, or None if out of budget.
+        """
+        start_count = board.foundation_count
+        start_key = position_key(board)
+        visited = {start_key}
+        level_keys = [start_key]  # Positions with as many foundation cards.
+        to_visit = [board]
+        expanded = 0
+        while to_visit:
+            if expanded >= SEARCH_LIMIT:
+                return None
+            expanded += 1
+            position = to_visit.pop()
+            for move in position.moves():
+                child = position.apply(move)
+                child_count = child.foundation_count
+                if child_count > start_count:
+                    return False
+                key = position_key(child)
+                if key in visited:
+                    continue
+                visited.add(key)
+                known = self._known.get(key)
+                if known:  # Dead child never gets past its own count.
+                    continue
+                if known is False and child_count == start_count:
+                    return False  # Child can make progress, so can we.
+                if child_count == start_count:
+                    level_keys.append(key)
+                to_visit.append(child)
+        # Nothing reachable gets past start_count, so every position seen
+        # with that many foundation cards is dead.
+        for key in level_keys:
+            self._known[key] = True
+        return True
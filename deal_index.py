@@ -0,0 +1,201 @@
+"""Hold DealIndex class for reading solved deal info from disk.
+
+The index file is laid out as a header, a table of difficulty bands, one
+fixed-width record per deal number, the deal numbers in each band, then a
+packed blob of solution moves. Moves are stored as (source, dest, card
+count), where source and dest are indexes into Game.spaces.
+"""
+
+import mmap
+import struct
+from random import Random
+from typing import NamedTuple, Optional
+
+MAGIC = b"FCDI"
+VERSION = 2
+
+HEADER = struct.Struct("<4sHI")  # Magic, version, record count.
+BAND = struct.Struct("<II")  # Deals in band, position of band's first deal.
+BAND_DEAL = struct.Struct("<I")  # Deal number.
+RECORD = struct.Struct("<BHIQ")  # Status, length, nodes, blob offset.
+MOVE = struct.Struct("<BBB")  # Source space, dest space, card count.
+
+STATUS_UNKNOWN = 0
+STATUS_SOLVABLE = 1
+STATUS_UNSOLVABLE = 2
+
+# Bands are ranges of nodes the solver expanded, upper bound excluded.
+DIFFICULTY_BANDS = {
+    "easy": (0, 1_000),
+    "medium": (1_000, 20_000),
+    "hard": (20_000, 2**32),
+}
+
+Move = tuple[int, int, int]
+
+
+class DealRecord(NamedTuple):
+    """Fixed-width info on a single deal."""
+
+    status: int
+    solution_length: int
+    nodes_expanded: int
+    offset: int
+
+    @property
+    def solvable(self):
+        """If the solver found a solution for the deal."""
+        return self.status == STATUS_SOLVABLE
+
+    @property
+    def difficulty(self):
+        """Name of the difficulty band the deal falls in, if solvable."""
+        if not self.solvable:
+            return None
+        for band, (low, high) in DIFFICULTY_BANDS.items():
+            if low <= self.nodes_expanded < high:
+                return band
+        return None
+
+
+class DealResult(NamedTuple):
+    """Solver output for a deal, used when writing the index."""
+
+    solvable: bool
+    nodes_expanded: int
+    solution: list[Move]
+
+
+class DealIndex:
+    """Read-only view of a deal index file."""
+
+    def __init__(self, path: str):
+        """Memory map the index file at path and check its header."""
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:  # Empty files can't be mapped.
+            self._file.close()
+            raise ValueError(f"{path} is not a deal index.") from e
+        try:
+            magic, version, count = HEADER.unpack_from(self._map, 0)
+        except struct.error as e:
+            self.close()
+            raise ValueError(f"{path} is not a deal index.") from e
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} deal index.")
+        self._count = count
+        self._records_start = HEADER.size + len(DIFFICULTY_BANDS) * BAND.size
+        self._band_deals_start = self._records_start + count * RECORD.size
+        if len(self._map) < self._band_deals_start:
+            self.close()
+            raise ValueError(f"{path} is missing deal records.")
+        self._bands = {}  # Band name to deal count and first deal position.
+        for i, band in enumerate(DIFFICULTY_BANDS):
+            self._bands[band] = BAND.unpack_from(self._map, HEADER.size + i * BAND.size)
+        band_deals = sum(band_count for band_count, _ in self._bands.values())
+        self._blob_start = self._band_deals_start + band_deals * BAND_DEAL.size
+        if len(self._map) < self._blob_start:
+            self.close()
+            raise ValueError(f"{path} is missing difficulty bands.")
+
+    def __len__(self):
+        return self._count
+
+    def close(self):
+        """Unmap and close the index file."""
+        self._map.close()
+        self._file.close()
+
+    def difficulty(self, deal: int):
+        """Get the difficulty band of a deal, or None if unrated."""
+        record = self.record(deal)
+        return record.difficulty if record else None
+
+    def hint(self, deal: int, step: int) -> Optional[Move]:
+        """Get the move at a given step of the deal's solution."""
+        record = self.record(deal)
+        if not record or not record.solvable:
+            return None
+        if not 0 <= step < record.solution_length:
+            return None
+        position = self._blob_start + record.offset + step * MOVE.size
+        return MOVE.unpack_from(self._map, position)
+
+    def pick_deal(self, band: str, rng: Optional[Random] = None):
+        """Pick a random deal number in the given difficulty band.
+
+        returns:
+            int | None: Deal number, or None if no deal is in the band.
+        """
+        if band not in DIFFICULTY_BANDS:
+            raise ValueError(f"Unknown difficulty band {band}.")
+        band_count, first = self._bands[band]
+        if not band_count:
+            return None
+        rng = rng if rng else Random()
+        position = first + rng.randrange(band_count)
+        offset = self._band_deals_start + position * BAND_DEAL.size
+        return BAND_DEAL.unpack_from(self._map, offset)[0]
+
+    def record(self, deal: int):
+        """Get the record for a deal number, or None if out of range."""
+        if not 0 <= deal < self._count:
+            return None
+        position = self._records_start + deal * RECORD.size
+        record = DealRecord(*RECORD.unpack_from(self._map, position))
+        solution_end = record.offset + record.solution_length * MOVE.size
+        if record.solvable and self._blob_start + solution_end > len(self._map):
+            raise ValueError(f"Solution for deal {deal} is missing from the index.")
+        return record
+
+    def solution(self, deal: int) -> list[Move]:
+        """Get the full list of solution moves for a deal."""
+        record = self.record(deal)
+        if not record or not record.solvable:
+            return []
+        start = self._blob_start + record.offset
+        end = start + record.solution_length * MOVE.size
+        return list(MOVE.iter_unpack(self._map[start:end]))
+
+
+def write_deal_index(path: str, results: dict[int, DealResult]):
+    """Write solver results to an index file, keyed by deal number.
+    Deal numbers missing from results are stored as unknown."""
+    count = max(results) + 1 if results else 0
+    records = bytearray(count * RECORD.size)  # Zeroed records are unknown.
+    band_deals: dict[str, list[int]] = {band: [] for band in DIFFICULTY_BANDS}
+    blob = bytearray()
+    for deal, result in sorted(results.items()):
+        if result.solvable:
+            status = STATUS_SOLVABLE
+            length = len(result.solution)
+        else:
+            status = STATUS_UNSOLVABLE
+            length = 0
+        RECORD.pack_into(
+            records,
+            deal * RECORD.size,
+            status,
+            length,
+            result.nodes_expanded,
+            len(blob),
+        )
+        if result.solvable:
+            for move in result.solution:
+                blob += MOVE.pack(*move)
+        band = DealRecord(status, length, result.nodes_expanded, 0).difficulty
+        if band:
+            band_deals[band].append(deal)
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, count))
+        first = 0
+        for deals in band_deals.values():
+            file.write(BAND.pack(len(deals), first))
+            first += len(deals)
+        file.write(records)
+        for deals in band_deals.values():
+            for deal in deals:
+                file.write(BAND_DEAL.pack(deal))
+        file.write(blob)
@@ -1,8 +1,12 @@
-from random import shuffle
+from random import Random, randrange
+import sys
 import time
 import pygame
+from board import Board
 from card import create_deck
 from constants import BUFFER_SIZE, CARD_WIDTH
+from deadlock import DeadlockDetector
+from deal_index import DIFFICULTY_BANDS, DealIndex
 from space import Space, Foundation, Tableau
 from stack import MoveStack
 
@@ -12,6 +16,9 @@ BG_COLOR = "#35654d"
 
 CLICKRELEASETIME = 0.2
 
+DEAL_INDEX_PATH = "./deals.idx"
+DEAL_COUNT = 1_000_000  # Deals to pick from when there's no index.
+
 
 class Game:
     """Main game object."""
@@ -23,11 +30,18 @@ class Game:
         self._free_cells: list[Space] = self.create_free_cells()
         self._tableau: list[Space] = self.create_tableau()
         self._held_stack: "MoveStack" | None = None
-        self._last_click = time.time()
-        self._moves: list[dict] = []
+        self._deal_index = self.load_deal_index()
+        self._deal_number = 0
+        self._last_click = self.get_time()
+        self._moves: list[list[dict]] = []  # Groups undone together.
+        self._unsorted_tableau: set[Space] = set()
         self._running = True
         self._won = False
+        self._lost = False
+        self._board_changed = False
+        self._deadlock = DeadlockDetector()
         self._win_text = self.create_win_text()
+        self._lose_text = self.create_lose_text()
         self._event_methods = {
             pygame.QUIT: self.quit,
             pygame.MOUSEBUTTONDOWN: self.handle_mouse_down,
@@ -51,6 +65,12 @@ class Game:
         # means they're all empty.
         return self.empty_spaces == 12
 
+    @property
+    def is_trivially_solved(self):
+        """Check if every tableau column only goes down in value, which means
+        the rest of the cards can go straight to the foundations."""
+        return not self._unsorted_tableau
+
     @property
     def sorted_tableau(self):
         """Return list of tableau spaces sorted so empty ones come last.
@@ -84,6 +104,14 @@ class Game:
                 moves_made = True
         return moves_made
 
+    def check_deadlock(self):
+        """Check if the current position can no longer make progress."""
+        self._board_changed = False
+        if self.has_won:
+            self._lost = False
+            return
+        self._lost = self._deadlock.is_dead(self.snapshot())
+
     def clear_hand(self):
         """Remove held stack from hand."""
         self._held_stack = None
@@ -91,7 +119,7 @@ class Game:
     def click_stack(self, move_stack: "MoveStack"):
         """Click a given stack, setting it to held."""
         self._held_stack = move_stack
-        move_stack.click(pygame.mouse.get_pos())
+        move_stack.click(self.get_cursor_pos())
 
     def create_foundations(self):
         """Create foundation spaces."""
@@ -115,6 +143,13 @@ class Game:
             x_pos -= CARD_WIDTH + BUFFER_SIZE
         return free_cells
 
+    def create_lose_text(self):
+        """create message for when no moves lead to progress."""
+        font = pygame.font.Font("freesansbold.ttf", 16)
+        message = "No moves left lead anywhere. Press z to undo."
+        text = font.render(message, True, (255, 255, 0))
+        return text
+
     def create_screen(self):
         """Create the main game surface."""
         screen = pygame.display.set_mode((450, 500))
@@ -142,16 +177,18 @@ class Game:
         text = font.render(message, True, (255, 255, 0))
         return text
 
-    def deal_cards(self):
-        """Deal cards to the tableaus."""
+    def deal_cards(self, deal_number: int):
+        """Deal cards to the tableaus, shuffled by the deal number."""
+        self._deal_number = deal_number
         deck = create_deck()
-        shuffle(deck)
+        Random(deal_number).shuffle(deck)
         for i in range(8):
             tab = self._tableau[i]
             stack_length = 6 + (i < 4)  # First four columns are 7 cards high.
             stack = MoveStack(tab, deck[:stack_length])
             stack.go_home()
             deck = deck[stack_length:]
+        self.track_sorted(*self._tableau)
 
     def draw(self):
         """Draw game."""
@@ -161,19 +198,25 @@ class Game:
         if self._held_stack:  # Draw held stack last.
             self._held_stack.draw(self._screen)
         if self._won:
-            self.draw_win_text()
+            self.draw_text(self._win_text)
+        elif self._lost:
+            self.draw_text(self._lose_text)
         pygame.display.update()
 
-    def draw_win_text(self):
-        """Draw the winning message."""
+    def draw_text(self, text: pygame.surface.Surface):
+        """Draw a message in the center of the screen."""
         # Center text rectangle on screen center.
-        text_rect = self._win_text.get_rect()
+        text_rect = text.get_rect()
         text_rect.center = self._screen.get_rect().center
-        self._screen.blit(self._win_text, text_rect)
+        self._screen.blit(text, text_rect)
+
+    def get_cursor_pos(self) -> tuple[int, int]:
+        """Get the current cursor position."""
+        return pygame.mouse.get_pos()
 
     def get_mouse_target(self):
         """Get target based off mouse position."""
-        cursor_pos = pygame.mouse.get_pos()
+        cursor_pos = self.get_cursor_pos()
         for space in self.spaces:
             target = space.check_for_target(cursor_pos)
             if target:
@@ -189,6 +232,10 @@ class Game:
                 return space
         return None
 
+    def get_time(self):
+        """Get the current time in seconds, used for click timing."""
+        return time.time()
+
     def get_valid_space(self, stack: "MoveStack", space_list: list["Space"]):
         """Check for a valid space in the given space list."""
         for space in space_list:
@@ -198,8 +245,29 @@ class Game:
                 return space
         return None
 
+    def finish_game(self):
+        """Move every card to the foundations as a single undoable move.
+        Only call when the game is trivially solved."""
+        move_group = []
+        moves_made = True
+        while moves_made:  # Continue until no more moves are made.
+            moves_made = False
+            for space in self._tableau + self._free_cells:
+                move_dict = self.move_to_found(space)
+                if move_dict:
+                    move_group.append(move_dict)
+                    moves_made = True
+        if not move_group:
+            return
+        self._moves.append(move_group)
+        self.track_sorted(*self._tableau)
+        self._board_changed = True
+
     def handle_a_key(self):
         """Move all exposed cards to foundations if possible."""
+        if self.is_trivially_solved:
+            self.finish_game()
+            return
         moves_made = True
         while moves_made:  # Continue until no more moves are made.
             moves_made = self.auto_foundation()
@@ -245,37 +313,90 @@ class Game:
 
     def handle_mouse_down(self):
         """Check to see if user clicked something."""
-        self._last_click = time.time()
+        self._last_click = self.get_time()
         target_stack = self.get_mouse_target()
         if target_stack:
             self.click_stack(target_stack)
 
     def handle_mouse_up(self):
         """Determine type of mouse release and act accordingly."""
-        time_between = time.time() - self._last_click
+        time_between = self.get_time() - self._last_click
         if time_between <= CLICKRELEASETIME:
             self.handle_click_release()
         else:
             self.handle_hold_release()
 
+    def load_deal_index(self):
+        """Open the deal index if one has been generated."""
+        try:
+            return DealIndex(DEAL_INDEX_PATH)
+        except (OSError, ValueError):
+            return None
+
     def make_move(self, stack: "MoveStack", space: "Space"):
         """Move stack over to new space and record it."""
         move_dict = stack.make_move(space)
-        self._moves.append(move_dict)
+        self.record_move(move_dict)
+
+    def move_to_found(self, space: "Space"):
+        """Try moving top card in space to founds without recording it.
+
+        returns:
+            dict | None: The move made, if there was one.
+        """
+        if space.is_empty:
+            return None
+        top_stack = space.make_sub_stack(space.top_card)
+        if not top_stack:
+            raise Exception(f"Failed to make top stack from {space}.")
+        destination = self.get_valid_space(top_stack, self._foundation)
+        if not destination:
+            top_stack.go_home()
+            return None
+        return top_stack.make_move(destination)
+
+    def pick_deal(self, difficulty: str | None = None):
+        """Pick a deal number, from the given difficulty band if possible."""
+        if difficulty and self._deal_index:
+            try:
+                deal_number = self._deal_index.pick_deal(difficulty)
+            except ValueError:  # Damaged index, so deal a random game.
+                deal_number = None
+            if deal_number is not None:
+                return deal_number
+        return randrange(DEAL_COUNT)
 
     def quit(self):
         """End the game."""
         self._running = False
 
-    def run(self):
+    def record_move(self, move_dict: dict):
+        """Record a move that was made, finishing the game if that leaves
+        it trivially solved."""
+        self._moves.append([move_dict])
+        self._board_changed = True
+        self.track_sorted(move_dict["source"], move_dict["dest"])
+        if self.is_trivially_solved:
+            self.finish_game()
+
+    def run(self, difficulty: str | None = None):
         """Run game until close."""
-        self.set_up_game()
+        self.set_up_game(difficulty)
         while self._running:
             self.tick()
 
-    def set_up_game(self):
-        """Prepare new game."""
-        self.deal_cards()
+    def set_up_game(self, difficulty: str | None = None):
+        """Prepare new game, optionally from a difficulty band."""
+        self.deal_cards(self.pick_deal(difficulty))
+        pygame.display.set_caption(f"FreeCell #{self._deal_number}")
+
+    def snapshot(self):
+        """Get a Board copy of the cards in every space."""
+        spaces = tuple(
+            tuple((card.value, card.suit) for card in space.stack.cards)
+            for space in self.spaces
+        )
+        return Board(spaces)
 
     def tick(self):
         """Run a single game tick."""
@@ -283,37 +404,52 @@ class Game:
         self.handle_events()
         self.update()
 
+    def track_sorted(self, *spaces: "Space"):
+        """Update which tableau columns are out of order after spaces change."""
+        for space in spaces:
+            if not isinstance(space, Tableau):
+                continue
+            if space.stack.is_sorted:
+                self._unsorted_tableau.discard(space)
+            else:
+                self._unsorted_tableau.add(space)
+
     def try_move_to_found(self, space: "Space"):
         """Try moving top card in space to founds and return if successful."""
-        if space.is_empty:
-            return False
-        top_stack = space.make_sub_stack(space.top_card)
-        if not top_stack:
-            raise Exception(f"Failed to make top stack from {space}.")
-        destination = self.get_valid_space(top_stack, self._foundation)
-        if not destination:
-            top_stack.go_home()
+        move_dict = self.move_to_found(space)
+        if not move_dict:
             return False
-        self.make_move(top_stack, destination)
+        self.record_move(move_dict)
         return True
 
     def undo(self):
-        """Undo last made move."""
+        """Undo last made move, or group of moves."""
         if not self._moves:
             return
-        last_move = self._moves[-1]
-        undo_stack = last_move["dest"].make_sub_stack(last_move["card"])
-        undo_stack.make_move(last_move["source"])
-        self._moves.pop()  # Remove undone move from moves.
+        last_group = self._moves[-1]
+        for last_move in reversed(last_group):  # Undo in reverse order.
+            undo_stack = last_move["dest"].make_sub_stack(last_move["card"])
+            undo_stack.make_move(last_move["source"])
+            self.track_sorted(last_move["source"], last_move["dest"])
+        self._moves.pop()  # Remove undone moves from moves.
+        self._board_changed = True
 
     def update(self):
         """Update for new tick."""
-        if self.has_won:
-            self._won = True
+        # Undo can take back a win, and held cards aren't in any space.
+        self._won = self.has_won and not self._held_stack
+        # Checked once a tick to keep frames short, and not while a stack is
+        # held since its cards aren't in any space.
+        if self._board_changed and not self._held_stack:
+            self.check_deadlock()
         if self._held_stack:
-            self._held_stack.drag(pygame.mouse.get_pos())
+            self._held_stack.drag(self.get_cursor_pos())
 
 
 if __name__ == "__main__":
+    difficulty = sys.argv[1] if len(sys.argv) > 1 else None
+    if difficulty and difficulty not in DIFFICULTY_BANDS:
+        bands = "|".join(DIFFICULTY_BANDS)
+        raise SystemExit(f"Usage: python game.py [{bands}]")
     game = Game()
-    game.run()
+    game.run(difficulty)
@@ -0,0 +1,160 @@
+"""Estimate how forgiving deals are with random playouts.
+
+Run as a script with deal numbers, e.g. python playout.py 1 2 3
+"""
+
+import argparse
+from math import sqrt
+from multiprocessing import Pool
+import os
+from random import Random
+import time
+from typing import NamedTuple, Optional
+from board import FOUNDATIONS, Board
+
+MAX_PLAYOUT_MOVES = 300  # Cut off playouts that are going in circles.
+BATCH_SIZE = 100  # Playouts per task sent to a worker.
+Z_SCORE = 1.96  # 95% confidence.
+
+POLICIES = ("greedy", "random")
+
+
+class WinRateEstimate(NamedTuple):
+    """Result of running playouts on a board."""
+
+    wins: int
+    playouts: int
+    low: float
+    high: float
+    playouts_per_core_second: float
+
+    @property
+    def rate(self):
+        """Fraction of playouts that were won."""
+        return self.wins / self.playouts if self.playouts else 0.0
+
+
+def greedy_move(board: Board, rng: Random):
+    """Pick a random stack and send it where a single click would."""
+    choices = []
+    for source in range(4, 16):
+        for count in range(1, board.movable_count(source) + 1):
+            dest = board.auto_dest(source, count)
+            if dest is not None:
+                choices.append((source, dest, count))
+    return rng.choice(choices) if choices else None
+
+
+def random_move(board: Board, rng: Random):
+    """Pick any legal move that doesn't take a card off the foundations."""
+    moves = [move for move in board.moves() if move[0] not in FOUNDATIONS]
+    return rng.choice(moves) if moves else None
+
+
+def playout(board: Board, policy: str, rng: Random):
+    """Play a board out until it's won, stuck, or runs too long.
+
+    returns:
+        bool: Whether or not the playout was won.
+    """
+    pick_move = greedy_move if policy == "greedy" else random_move
+    for _ in range(MAX_PLAYOUT_MOVES):
+        board = board.finish()[0]  # Like pressing a after every move.
+        if board.has_won:
+            return True
+        move = pick_move(board, rng)
+        if not move:
+            return False
+        board = board.apply(move)
+    return board.has_won
+
+
+def run_batch(board: Board, policy: str, count: int, seed: int):
+    """Run a batch of playouts in a worker.
+
+    returns:
+        tuple[int, int, float]: Wins, playouts, and cpu seconds taken.
+    """
+    start = time.process_time()
+    rng = Random(seed)
+    wins = sum(playout(board, policy, rng) for _ in range(count))
+    return wins, count, time.process_time() - start
+
+
+def wilson_interval(wins: int, playouts: int, z: float = Z_SCORE):
+    """Get the Wilson score interval for a win rate."""
+    if not playouts:
+        return 0.0, 1.0
+    rate = wins / playouts
+    denominator = 1 + z**2 / playouts
+    center = (rate + z**2 / (2 * playouts)) / denominator
+    margin = z * sqrt(rate * (1 - rate) / playouts + z**2 / (4 * playouts**2))
+    margin /= denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def estimate_win_rate(
+    board: Board,
+    policy: str = "greedy",
+    max_playouts: int = 10_000,
+    tolerance: float = 0.02,
+    processes: Optional[int] = None,
+    seed: int = 0,
+):
+    """Run playouts on a board in a process pool until the confidence
+    interval is within tolerance either side, or max_playouts is reached."""
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown playout policy {policy}.")
+    processes = processes if processes else os.cpu_count() or 1
+    wins = playouts = 0
+    cpu_seconds = 0.0
+    low, high = wilson_interval(wins, playouts)
+    batch = 0
+    with Pool(processes) as pool:
+        while playouts < max_playouts:
+            # Send one round of batches at a time so we can stop early.
+            tasks = []
+            planned = playouts
+            while len(tasks) < processes and planned < max_playouts:
+                size = min(BATCH_SIZE, max_playouts - planned)
+                tasks.append((board, policy, size, seed + batch))
+                planned += size
+                batch += 1
+            for batch_wins, batch_playouts, seconds in pool.starmap(run_batch, tasks):
+                wins += batch_wins
+                playouts += batch_playouts
+                cpu_seconds += seconds
+            low, high = wilson_interval(wins, playouts)
+            if (high - low) / 2 <= tolerance:
+                break
+    throughput = playouts / cpu_seconds if cpu_seconds else 0.0
+    return WinRateEstimate(wins, playouts, low, high, throughput)
+
+
+def main():
+    """Print win rate estimates for deals given on the command line."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("deals", type=int, nargs="+")
+    parser.add_argument("--policy", choices=POLICIES, default="greedy")
+    parser.add_argument("--playouts", type=int, default=10_000)
+    parser.add_argument("--tolerance", type=float, default=0.02)
+    parser.add_argument("--processes", type=int)
+    args = parser.parse_args()
+    for deal in args.deals:
+        estimate = estimate_win_rate(
+            Board.deal(deal),
+            args.policy,
+            args.playouts,
+            args.tolerance,
+            args.processes,
+        )
+        print(
+            f"Deal {deal}: {estimate.rate:.1%} won "
+            f"({estimate.low:.1%} - {estimate.high:.1%}) "
+            f"in {estimate.playouts} playouts, "
+            f"{estimate.playouts_per_core_second:.0f} playouts/s/core"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Play the game while recording input to a trace file for replay.py.
+
+Run with python record.py trace.jsonl, optionally followed by a difficulty.
+"""
+
+import json
+import sys
+import time
+import pygame
+from deal_index import DIFFICULTY_BANDS
+from game import Game
+
+# Event attributes the game reads, everything else is left out of traces.
+TRACE_ATTRIBUTES = ("pos", "button", "key")
+
+
+def event_to_dict(event: pygame.event.Event):
+    """Turn an event into a dict that can be written as json."""
+    event_dict: dict = {"type": event.type}
+    for attribute in TRACE_ATTRIBUTES:
+        if attribute in event.dict:
+            value = event.dict[attribute]
+            event_dict[attribute] = list(value) if attribute == "pos" else value
+    return event_dict
+
+
+def dict_to_event(event_dict: dict):
+    """Turn a dict from a trace back into an event."""
+    attributes = {key: value for key, value in event_dict.items() if key != "type"}
+    if "pos" in attributes:
+        attributes["pos"] = tuple(attributes["pos"])
+    return pygame.event.Event(event_dict["type"], attributes)
+
+
+class RecordingGame(Game):
+    """Game that writes its events to a trace file each tick.
+
+    The first line of a trace holds the deal number. Every line after is a
+    frame with the time since start, cursor position, and events handled.
+    Frames where nothing happened are skipped.
+    """
+
+    def __init__(self, path: str):
+        """Set up game and open trace file at path."""
+        self._start = time.time()
+        self._frame_time = 0.0  # Set before Game init, which reads the time.
+        super().__init__()
+        self._trace = open(path, "w")
+        self._last_cursor = (-1, -1)
+
+    def handle_events(self):
+        """Handle game events, recording them first."""
+        events = pygame.event.get()
+        cursor_pos = self.get_cursor_pos()
+        self._frame_time = time.time() - self._start
+        if events or cursor_pos != self._last_cursor:
+            frame = {
+                "time": self._frame_time,
+                "cursor": list(cursor_pos),
+                "events": [event_to_dict(event) for event in events],
+            }
+            self._trace.write(json.dumps(frame) + "\n")
+            self._last_cursor = cursor_pos
+        for event in events:
+            self.handle_event(event)
+
+    def get_time(self):
+        """Get the time of the current frame, as written to the trace."""
+        return self._frame_time
+
+    def run(self, difficulty: str | None = None):
+        """Run game until close, then close the trace."""
+        try:
+            super().run(difficulty)
+        finally:
+            self._trace.close()
+
+    def set_up_game(self, difficulty: str | None = None):
+        """Prepare new game and write its deal number."""
+        super().set_up_game(difficulty)
+        self._trace.write(json.dumps({"deal": self._deal_number}) + "\n")
+
+
+if __name__ == "__main__":
+    difficulty = sys.argv[2] if len(sys.argv) > 2 else None
+    if len(sys.argv) < 2 or (difficulty and difficulty not in DIFFICULTY_BANDS):
+        bands = "|".join(DIFFICULTY_BANDS)
+        raise SystemExit(f"Usage: python record.py trace.jsonl [{bands}]")
+    game = RecordingGame(sys.argv[1])
+    game.run(difficulty)
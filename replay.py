@@ -0,0 +1,95 @@
+"""Replay a trace from record.py without a window and time each frame.
+
+Run with python replay.py trace.jsonl
+"""
+
+import argparse
+import json
+import os
+import statistics
+import time
+
+# Must be set before pygame is initialised by importing the game.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from game import Game  # noqa: E402
+from record import dict_to_event  # noqa: E402
+
+
+class ReplayGame(Game):
+    """Game driven by a trace, with a virtual clock and cursor."""
+
+    def __init__(self, path: str):
+        """Load trace at path and set up game."""
+        self._clock = 0.0  # Set before Game init, which reads the time.
+        self._cursor = (0, 0)
+        with open(path) as trace:
+            header = json.loads(trace.readline())
+            self._trace_deal: int = header["deal"]
+            self._frames = [json.loads(line) for line in trace if line.strip()]
+        super().__init__()
+
+    def get_cursor_pos(self):
+        """Get the cursor position from the current frame."""
+        return self._cursor
+
+    def get_time(self):
+        """Get the time from the current frame."""
+        return self._clock
+
+    def run(self, difficulty: str | None = None):
+        """Replay every frame in the trace.
+
+        returns:
+            list[float]: Seconds taken by each frame.
+        """
+        self.set_up_game(difficulty)
+        timings = []
+        for frame in self._frames:
+            if not self._running:
+                break
+            self._clock = frame["time"]
+            self._cursor = tuple(frame["cursor"])
+            events = [dict_to_event(event) for event in frame["events"]]
+            start = time.perf_counter()
+            # Same order as Game.tick.
+            self.draw()
+            for event in events:
+                self.handle_event(event)
+            self.update()
+            timings.append(time.perf_counter() - start)
+        return timings
+
+    def set_up_game(self, difficulty: str | None = None):
+        """Deal the game the trace was recorded with."""
+        self.deal_cards(self._trace_deal)
+
+
+def report(timings: list[float]):
+    """Summarise frame timings in milliseconds."""
+    millis = sorted(timing * 1000 for timing in timings)
+    if not millis:
+        return "No frames replayed."
+    p95 = millis[min(len(millis) - 1, int(len(millis) * 0.95))]
+    return (
+        f"{len(millis)} frames: mean {statistics.mean(millis):.3f} ms, "
+        f"median {statistics.median(millis):.3f} ms, "
+        f"p95 {p95:.3f} ms, max {millis[-1]:.3f} ms"
+    )
+
+
+def main():
+    """Replay a trace and print its frame timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("trace")
+    parser.add_argument("--frames", action="store_true", help="Print every frame.")
+    args = parser.parse_args()
+    timings = ReplayGame(args.trace).run()
+    if args.frames:
+        for i, timing in enumerate(timings):
+            print(f"{i}\t{timing * 1000:.3f}")
+    print(report(timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 """Hold code for mantaining spritesheet for cards."""
 import pygame
-from constants import CARD_HEIGHT, CARD_WIDTH
+from constants import CARD_HEIGHT, CARD_WIDTH, SUITS
 
 
 class SpriteSheet:
@@ -14,7 +14,7 @@ class SpriteSheet:
         except pygame.error as e:
             print(f"Unable to load spritesheet image: {filename}")
             raise SystemExit(e)
-        self.suits = ["clubs", "diamonds", "hearts", "spades"]
+        self.suits = SUITS
 
     def image_at(self, rectangle):
         """Load a specific image from a specific rectangle."""
@@ -62,6 +62,14 @@ class Stack:
         """If there are no cards in the stack."""
         return not bool(self._cards)
 
+    @property
+    def is_sorted(self):
+        """If card values never go up from the bottom of the stack."""
+        return all(
+            self._cards[i].value <= self._cards[i - 1].value
+            for i in range(1, len(self._cards))
+        )
+
     @property
     def length(self):
         """Return amount of cards in stack."""
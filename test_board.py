@@ -0,0 +1,74 @@
+"""Check that Board follows the same rules as Game.
+
+Run with python -m pytest from the repository root.
+"""
+
+import os
+from random import Random
+
+# Must be set before pygame is initialised by importing the game.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from board import Board  # noqa: E402
+from game import Game  # noqa: E402
+
+
+def game_moves(game: Game):
+    """Get every move the game allows, as board moves."""
+    moves = []
+    spaces = game.spaces
+    for source, space in enumerate(spaces):
+        for card in list(space.stack.cards):
+            stack = space.make_sub_stack(card)
+            if not stack:
+                continue
+            for dest, dest_space in enumerate(spaces):
+                if dest == source:
+                    continue
+                if dest_space.valid_dest(stack, game.empty_spaces):
+                    moves.append((source, dest, stack.length))
+            stack.go_home()
+    return moves
+
+
+def game_auto_dest(game: Game, source: int, count: int):
+    """Get where a click would send the top count cards of a space."""
+    space = game.spaces[source]
+    stack = space.make_sub_stack(space.stack.cards[-count])
+    dest = game.auto_dest(stack)
+    stack.go_home()
+    return game.spaces.index(dest) if dest else None
+
+
+def test_deal_matches_game():
+    """Boards and games dealt from the same number match."""
+    for deal_number in range(5):
+        game = Game()
+        game.deal_cards(deal_number)
+        assert game.snapshot() == Board.deal(deal_number)
+
+
+def test_moves_match_game():
+    """Random move sequences stay in step between Game and Board."""
+    for deal_number in range(5):
+        game = Game()
+        game.deal_cards(deal_number)
+        board = Board.deal(deal_number)
+        rng = Random(deal_number)
+        for _ in range(40):
+            moves = board.moves()
+            assert sorted(moves) == sorted(game_moves(game))
+            for source in range(16):
+                for count in range(1, board.movable_count(source) + 1):
+                    expected = game_auto_dest(game, source, count)
+                    assert board.auto_dest(source, count) == expected
+            if not moves:
+                break
+            source, dest, count = rng.choice(moves)
+            space = game.spaces[source]
+            stack = space.make_sub_stack(space.stack.cards[-count])
+            game.make_move(stack, game.spaces[dest])
+            if game.is_trivially_solved:  # Game finishes itself from here.
+                break
+            board = board.apply((source, dest, count))
+            assert game.snapshot() == board
@@ -0,0 +1,92 @@
+"""Check DeadlockDetector on small hand-built boards."""
+
+from board import Board
+from deadlock import DeadlockDetector, position_key
+
+KINGS = [(13, "clubs"), (13, "diamonds"), (13, "hearts"), (13, "spades")]
+
+
+def make_board(foundations, free_cells, tableau):
+    """Build a board from lists of cards for each space."""
+    spaces = [tuple(cards) for cards in foundations]
+    spaces += [(card,) for card in free_cells]
+    spaces += [tuple(cards) for cards in tableau]
+    return Board(tuple(spaces))
+
+
+def suit_run(suit, high):
+    """Cards of a suit from ace up to high."""
+    return [(value, suit) for value in range(1, high + 1)]
+
+
+def stuck_board(last_column):
+    """Aces buried under twos, with full free cells and no stacking moves."""
+    tableau = [
+        [(1, "clubs"), (2, "clubs")],
+        [(1, "diamonds"), (2, "diamonds")],
+        [(1, "hearts"), (2, "hearts")],
+        [(1, "spades"), (2, "spades")],
+        [(5, "clubs")],
+        [(9, "spades")],
+        [(5, "diamonds")],
+        last_column,
+    ]
+    return make_board([[], [], [], []], KINGS, tableau)
+
+
+def foundation_board(column_one):
+    """Clubs and diamonds up to 4 on the foundations, where the only way
+    forward is taking 4 of diamonds back off onto 5 of spades."""
+    tableau = [
+        [(6, "clubs"), (5, "clubs"), (3, "spades")],
+        column_one,
+        [(9, "hearts")],
+        [(11, "hearts")],
+        [(12, "diamonds")],
+        [(7, "spades")],
+        [(10, "diamonds")],
+        [(2, "spades")],
+    ]
+    foundations = [suit_run("clubs", 4), suit_run("diamonds", 4), [], []]
+    return make_board(foundations, KINGS, tableau)
+
+
+def test_dead_board():
+    """A board with no moves that free an ace is dead."""
+    assert DeadlockDetector().is_dead(stuck_board([(7, "hearts")]))
+
+
+def test_live_board():
+    """Moving 2 of clubs onto 3 of hearts frees an ace."""
+    assert not DeadlockDetector().is_dead(stuck_board([(3, "hearts")]))
+
+
+def test_moves_off_foundations_are_tried():
+    """Progress that needs a card taken off the foundations is found."""
+    assert not DeadlockDetector().is_dead(foundation_board([(5, "spades")]))
+
+
+def test_dead_cache_keeps_foundation_count():
+    """Only positions with the searched board's foundation count are
+    cached as dead, even though the search takes cards off them."""
+    detector = DeadlockDetector()
+    # 4 of clubs can go onto 5 of hearts and back, but that goes nowhere.
+    board = foundation_board([(5, "hearts")])
+    assert detector.is_dead(board)
+    dead_keys = [key for key, dead in detector._known.items() if dead]
+    child = board.apply((0, 9, 1))  # 4 of clubs onto 5 of hearts.
+    assert position_key(child) not in dead_keys
+    for foundations, _, _ in dead_keys:
+        assert sum(len(cards) for cards in foundations) == board.foundation_count
+
+
+def test_undecided_boards_are_not_searched_again(monkeypatch):
+    """Boards the budget can't decide are remembered as not dead."""
+    detector = DeadlockDetector()
+    board = stuck_board([(7, "hearts")])
+    monkeypatch.setattr("deadlock.SEARCH_LIMIT", 0)
+    assert not detector.is_dead(board)
+    searches = []
+    monkeypatch.setattr(detector, "search", searches.append)
+    assert not detector.is_dead(board)
+    assert not searches
@@ -0,0 +1,74 @@
+"""Check that deal indexes read back what was written."""
+
+from random import Random
+import pytest
+from deal_index import (
+    DealIndex,
+    DealResult,
+    STATUS_UNKNOWN,
+    STATUS_UNSOLVABLE,
+    write_deal_index,
+)
+
+RESULTS = {
+    0: DealResult(True, 10, [(8, 0, 1), (9, 4, 1)]),
+    3: DealResult(False, 50_000, []),
+    5: DealResult(True, 5_000, [(10, 11, 2)]),
+    6: DealResult(True, 700, [(12, 1, 1)]),
+}
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    """Write RESULTS to an index file."""
+    path = tmp_path / "deals.idx"
+    write_deal_index(str(path), RESULTS)
+    return path
+
+
+def test_round_trip(index_path):
+    """Records, solutions and hints match what was written."""
+    index = DealIndex(str(index_path))
+    assert len(index) == 7
+    assert index.record(0).solution_length == 2
+    assert index.record(0).nodes_expanded == 10
+    assert index.record(1).status == STATUS_UNKNOWN
+    assert index.record(3).status == STATUS_UNSOLVABLE
+    assert index.record(7) is None
+    assert index.solution(0) == [(8, 0, 1), (9, 4, 1)]
+    assert index.solution(5) == [(10, 11, 2)]
+    assert index.solution(3) == []
+    assert index.hint(0, 1) == (9, 4, 1)
+    assert index.hint(0, 2) is None
+    assert index.difficulty(5) == "medium"
+    assert index.difficulty(3) is None
+    index.close()
+
+
+def test_pick_deal(index_path):
+    """Picked deals come from the requested band."""
+    index = DealIndex(str(index_path))
+    rng = Random(0)
+    assert {index.pick_deal("easy", rng) for _ in range(20)} == {0, 6}
+    assert index.pick_deal("medium", rng) == 5
+    assert index.pick_deal("hard", rng) is None  # Deal 3 has no solution.
+    with pytest.raises(ValueError):
+        index.pick_deal("Hard")
+    index.close()
+
+
+def test_truncated_files(index_path, tmp_path):
+    """Cut off files raise ValueError instead of struct errors."""
+    data = index_path.read_bytes()
+    cut_path = tmp_path / "cut.idx"
+    # Empty, mid header, mid records, and mid band deal numbers.
+    for size in (0, 5, 40, 145):
+        cut_path.write_bytes(data[:size])
+        with pytest.raises(ValueError):
+            DealIndex(str(cut_path))
+    cut_path.write_bytes(data[:-1])  # Missing the end of the last solution.
+    index = DealIndex(str(cut_path))
+    assert index.solution(0) == [(8, 0, 1), (9, 4, 1)]
+    with pytest.raises(ValueError):
+        index.solution(6)
+    index.close()
@@ -0,0 +1,52 @@
+"""Check that trivially solved games finish in one undoable group."""
+
+import os
+
+# Must be set before pygame is initialised by importing the game.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from card import create_deck  # noqa: E402
+from game import Game  # noqa: E402
+
+
+def nearly_sorted_game():
+    """Game where every column is sorted apart from 2 of spades sitting on
+    the ace of spades in tableau 4."""
+    game = Game()
+    tableau = game.spaces[8:]
+    cards = {(card.suit, card.value): card for card in create_deck()}
+    for column, suit in enumerate(["clubs", "diamonds", "hearts", "spades"]):
+        low = 3 if suit == "spades" else 1
+        for value in range(13, low - 1, -1):
+            cards[(suit, value)].go_to_space(tableau[column])
+    cards[("spades", 1)].go_to_space(tableau[4])
+    cards[("spades", 2)].go_to_space(tableau[4])
+    game.track_sorted(*tableau)
+    return game
+
+
+def test_move_into_sorted_board_finishes():
+    """The move that sorts the board logs alone, then the finish logs as
+    one group that a single undo takes back."""
+    game = nearly_sorted_game()
+    tableau = game.spaces[8:]
+    assert not game.is_trivially_solved
+    start = game.snapshot()
+
+    stack = tableau[4].make_sub_stack(tableau[4].top_card)
+    game.make_move(stack, game.spaces[4])
+    game.update()
+    assert game.has_won
+    assert game._won
+    assert [len(group) for group in game._moves] == [1, 52]
+
+    game.undo()
+    game.update()
+    assert not game._won
+    assert game.snapshot() == start.apply((12, 4, 1))  # 2 in free cell.
+    assert [len(group) for group in game._moves] == [1]
+    assert game.is_trivially_solved
+
+    game.undo()
+    assert game.snapshot() == start
+    assert not game.is_trivially_solved
@@ -0,0 +1,24 @@
+"""Check that recorded traces replay to the board they were recorded on."""
+
+import os
+from board import Board
+from replay import ReplayGame, report
+
+TRACE = os.path.join(os.path.dirname(__file__), "traces", "clicks.jsonl")
+
+# Tableau columns clicked in the trace. It then holds and drops the top
+# card of column 0 back in place, and presses z to undo the last click.
+CLICKED_COLUMNS = [2, 1, 4, 1, 7, 7, 2, 1, 5, 1]
+
+
+def test_replay_matches_board():
+    """Replaying the trace ends on the board its clicks lead to."""
+    game = ReplayGame(TRACE)
+    timings = game.run()
+    assert len(timings) == 25
+    board = Board.deal(3)
+    for column in CLICKED_COLUMNS[:-1]:  # Last click is undone.
+        source = 8 + column
+        board = board.apply((source, board.auto_dest(source, 1), 1))
+    assert game.snapshot() == board
+    assert report(timings).startswith("25 frames")